@@ -76,7 +76,7 @@ async def main():
 
     # 履歴の表示
     print("\n--- 対話履歴 ---")
-    for i, interaction in enumerate(agent.get_history(), 1):
+    for i, interaction in enumerate(agent.get_history(human=True), 1):
         print(f"{i}. 入力: {interaction['input']}")
         print(f"   出力: {interaction['output']}")
         print(f"   時刻: {interaction['timestamp']}")
@@ -7,13 +7,15 @@
 
 import asyncio
 import os
+import sys
 import argparse
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Set, Tuple, Union
 from datetime import datetime
 from dotenv import load_dotenv
 
 from src.agents.shiritori_agent import ShiritoriAgent
 from src.models.a2a_message import MessageType
+from src.services.runtime import run
 
 # 環境変数を読み込み
 load_dotenv()
@@ -30,15 +32,35 @@ class ShiritoriGame:
         agent2: 2番目のエージェント（フレア）
         max_turns: 最大ターン数
         timeout: レスポンスタイムアウト（秒）
-        game_log: ゲームログ
+        game_log: ゲームログ（ターン、エージェント名、単語、経過時間を列ごとに保持）
+        _semaphore: LLM呼び出しの同時実行数を制限するセマフォ（複数ゲームで共有）
+        _prefix: 各出力行の先頭に付けるゲームの識別ラベル
     """
 
+    __slots__ = (
+        "agent1",
+        "agent2",
+        "max_turns",
+        "timeout",
+        "_log_turns",
+        "_log_agents",
+        "_log_words",
+        "_log_times",
+        "winner",
+        "game_result",
+        "_log_q",
+        "_semaphore",
+        "_prefix",
+    )
+
     def __init__(
         self,
         agent1_name: str = "ノエル",
         agent2_name: str = "フレア",
         max_turns: int = 20,
-        timeout: float = 180.0
+        timeout: float = 180.0,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        label: Optional[str] = None
     ):
         """
         ゲームの初期化
@@ -48,25 +70,108 @@ class ShiritoriGame:
             agent2_name: エージェント2の名前
             max_turns: 最大ターン数
             timeout: レスポンスタイムアウト（秒）
+            semaphore: LLM呼び出しの同時実行数を制限するセマフォ（オプション）
+            label: 出力行に付けるゲームの識別ラベル（並行実行時に使用）
         """
         self.agent1 = ShiritoriAgent(name=agent1_name, timeout=timeout)
         self.agent2 = ShiritoriAgent(name=agent2_name, timeout=timeout)
         self.max_turns = max_turns
         self.timeout = timeout
-        self.game_log = []
+        self._log_turns: List[int] = []
+        self._log_agents: List[str] = []
+        self._log_words: List[str] = []
+        self._log_times: List[float] = []
         self.winner: Optional[str] = None
         self.game_result: Optional[str] = None
+        self._log_q: Optional["asyncio.Queue[Optional[str]]"] = None
+        self._semaphore = semaphore
+        self._prefix = f"[{label}] " if label else ""
+
+    @property
+    def game_log(self) -> List[Dict[str, Any]]:
+        """
+        ゲームログを1ターン1辞書の形式で取得
+
+        Returns:
+            ゲームログのリスト
+        """
+        return [
+            {"turn": turn, "agent": agent, "word": word, "elapsed_time": elapsed}
+            for turn, agent, word, elapsed in zip(
+                self._log_turns,
+                self._log_agents,
+                self._log_words,
+                self._log_times
+            )
+        ]
+
+    def _record_turn(
+        self,
+        turn: int,
+        agent_name: str,
+        word: str,
+        elapsed_time: float
+    ) -> None:
+        """
+        ターンをゲームログに記録
+
+        Args:
+            turn: ターン番号
+            agent_name: エージェント名
+            word: 発言した単語
+            elapsed_time: 経過時間（秒）
+        """
+        self._log_turns.append(turn)
+        self._log_agents.append(agent_name)
+        self._log_words.append(word)
+        self._log_times.append(elapsed_time)
+
+    def _emit(self, line: str = "") -> None:
+        """
+        1行を出力
+
+        ゲーム実行中は出力キューに積み、書き込みタスクがまとめて標準出力に書き出します。
+        ラベルが指定されている場合は行頭に付けます。
+
+        Args:
+            line: 出力する行
+        """
+        if self._prefix:
+            line = self._prefix + line.replace("\n", "\n" + self._prefix)
+        if self._log_q is None:
+            sys.stdout.write(line + "\n")
+        else:
+            self._log_q.put_nowait(line + "\n")
+
+    @staticmethod
+    async def _writer(queue: "asyncio.Queue[Optional[str]]") -> None:
+        """
+        出力キューの内容をまとめて標準出力に書き出す
+
+        Noneを受け取るまでキューを消費し、溜まっている行を1回の書き込みで出力します。
+
+        Args:
+            queue: 出力キュー
+        """
+        while True:
+            lines = [await queue.get()]
+            while not queue.empty():
+                lines.append(queue.get_nowait())
+            sys.stdout.write("".join(line for line in lines if line is not None))
+            sys.stdout.flush()
+            if None in lines:
+                return
 
     def _print_header(self) -> None:
         """ゲームヘッダーを表示"""
-        print("=" * 80)
-        print("🎮 しりとりゲーム - A2Aプロトコル版")
-        print("=" * 80)
-        print(f"参加者: {self.agent1.name} 🆚 {self.agent2.name}")
-        print(f"最大ターン数: {self.max_turns}")
-        print(f"タイムアウト: {self.timeout}秒")
-        print("=" * 80)
-        print()
+        self._emit("=" * 80)
+        self._emit("🎮 しりとりゲーム - A2Aプロトコル版")
+        self._emit("=" * 80)
+        self._emit(f"参加者: {self.agent1.name} 🆚 {self.agent2.name}")
+        self._emit(f"最大ターン数: {self.max_turns}")
+        self._emit(f"タイムアウト: {self.timeout}秒")
+        self._emit("=" * 80)
+        self._emit()
 
     def _print_turn(
         self,
@@ -84,7 +189,7 @@ class ShiritoriGame:
             word: 発言した単語
             elapsed_time: 経過時間（秒）
         """
-        print(f"ターン {turn:3d} | {agent_name:8s} | 「{word}」 ({elapsed_time:.2f}秒)")
+        self._emit(f"ターン {turn:3d} | {agent_name:8s} | 「{word}」 ({elapsed_time:.2f}秒)")
 
     def _print_game_over(
         self,
@@ -98,66 +203,151 @@ class ShiritoriGame:
             reason: 終了理由
             winner: 勝者（引き分けの場合はNone）
         """
-        print()
-        print("=" * 80)
-        print("🏁 ゲーム終了")
-        print("=" * 80)
-        print(f"終了理由: {reason}")
+        self._emit()
+        self._emit("=" * 80)
+        self._emit("🏁 ゲーム終了")
+        self._emit("=" * 80)
+        self._emit(f"終了理由: {reason}")
 
         if winner:
-            print(f"🎉 勝者: {winner}")
+            self._emit(f"🎉 勝者: {winner}")
         else:
-            print("🤝 引き分け")
+            self._emit("🤝 引き分け")
 
-        print("=" * 80)
+        self._emit("=" * 80)
+
+    @staticmethod
+    def _aggregate(
+        history: List[Dict[str, Any]],
+        unique_words: Set[str]
+    ) -> Tuple[int, str]:
+        """
+        エージェントの発言履歴を1回の走査で集計
+
+        ShiritoriAgentの履歴には自身の発言のみが記録されるため、
+        エージェント名での絞り込みは行いません。
+
+        Args:
+            history: エージェントの履歴
+            unique_words: 発言された単語を追加するセット
+
+        Returns:
+            (発言回数, カンマ区切りの使用単語)のタプル
+        """
+        words = [h['word'] for h in history]
+        unique_words.update(words)
+        return len(words), ', '.join(words)
 
     def _print_statistics(self) -> None:
         """ゲーム統計を表示"""
-        print()
-        print("📊 ゲーム統計")
-        print("-" * 80)
-
-        # エージェント1の統計
-        stats1 = self.agent1.get_game_stats()
-        print(f"{stats1['agent_name']}:")
-        print(f"  - 発言回数: {len([h for h in stats1['history'] if h['agent'] == stats1['agent_name']])}")
-        print(f"  - 使用単語: {', '.join([h['word'] for h in stats1['history'] if h['agent'] == stats1['agent_name']])}")
-
-        # エージェント2の統計
-        stats2 = self.agent2.get_game_stats()
-        print(f"{stats2['agent_name']}:")
-        print(f"  - 発言回数: {len([h for h in stats2['history'] if h['agent'] == stats2['agent_name']])}")
-        print(f"  - 使用単語: {', '.join([h['word'] for h in stats2['history'] if h['agent'] == stats2['agent_name']])}")
+        self._emit()
+        self._emit("📊 ゲーム統計")
+        self._emit("-" * 80)
+
+        unique_words: Set[str] = set()
+        for agent in (self.agent1, self.agent2):
+            stats = agent.get_game_stats()
+            count, words = self._aggregate(stats['history'], unique_words)
+            self._emit(f"{stats['agent_name']}:")
+            self._emit(f"  - 発言回数: {count}")
+            self._emit(f"  - 使用単語: {words}")
 
         # 全体統計
-        all_words = stats1['used_words'] + stats2['used_words']
-        unique_words = set(all_words)
-        print(f"\n総ターン数: {len(self.game_log)}")
-        print(f"使用単語数: {len(unique_words)}")
-        print(f"全使用単語: {' → '.join([log['word'] for log in self.game_log])}")
+        self._emit(f"\n総ターン数: {len(self._log_words)}")
+        self._emit(f"使用単語数: {len(unique_words)}")
+        self._emit(f"全使用単語: {' → '.join(self._log_words)}")
+
+        self._emit("-" * 80)
+
+    async def _process(
+        self,
+        agent: ShiritoriAgent,
+        input_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        エージェントに入力を処理させる
+
+        セマフォが指定されている場合は、その範囲内で実行します。
+        1回の処理で行うLLM呼び出しは最大1回です。
+
+        Args:
+            agent: 処理するエージェント
+            input_data: 入力データ
+
+        Returns:
+            処理結果
+        """
+        if self._semaphore is None:
+            return await agent.process(input_data)
+        async with self._semaphore:
+            return await agent.process(input_data)
+
+    async def _take_turn(
+        self,
+        agent: ShiritoriAgent,
+        word: str,
+        opponent: ShiritoriAgent
+    ) -> Tuple[Dict[str, Any], float]:
+        """
+        1ターン分の応答を実行して経過時間を計測
 
-        print("-" * 80)
+        Args:
+            agent: 応答するエージェント
+            word: 直前の単語
+            opponent: 相手のエージェント
+
+        Returns:
+            (応答結果, 経過時間（秒）)のタプル
+        """
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        result = await self._process(agent, {
+            "action": "respond",
+            "word": word,
+            "opponent": opponent.name
+        })
+        elapsed = loop.time() - start_time
+        return result, elapsed
 
     async def play(self) -> Dict[str, Any]:
         """
         ゲームを開始して実行
 
+        Returns:
+            ゲーム結果
+        """
+        self._log_q = asyncio.Queue()
+        writer = asyncio.create_task(self._writer(self._log_q))
+        try:
+            return await self._play()
+        finally:
+            # 残りの出力を書き出してから書き込みタスクを終了
+            self._log_q.put_nowait(None)
+            self._log_q = None
+            await writer
+
+    async def _play(self) -> Dict[str, Any]:
+        """
+        ゲームの本体を実行
+
         Returns:
             ゲーム結果
         """
         self._print_header()
 
+        loop = asyncio.get_running_loop()
+
         try:
             # ゲーム開始：ノエルが最初の単語を発言
-            print("🎬 ゲーム開始！")
-            print()
+            self._emit("🎬 ゲーム開始！")
+            self._emit()
 
-            start_time = datetime.now()
-            result = await self.agent1.process({
+            start_time = loop.time()
+            result = await self._process(self.agent1, {
                 "action": "start",
                 "opponent": self.agent2.name
             })
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = loop.time() - start_time
 
             if not result["success"]:
                 self._print_game_over(
@@ -174,12 +364,7 @@ class ShiritoriGame:
             current_turn = 1
 
             self._print_turn(current_turn, self.agent1.name, current_word, elapsed)
-            self.game_log.append({
-                "turn": current_turn,
-                "agent": self.agent1.name,
-                "word": current_word,
-                "elapsed_time": elapsed
-            })
+            self._record_turn(current_turn, self.agent1.name, current_word, elapsed)
 
             # ゲームループ
             current_agent = self.agent2
@@ -188,20 +373,16 @@ class ShiritoriGame:
             while current_turn < self.max_turns:
                 current_turn += 1
 
-                # 現在のエージェントが応答
-                start_time = datetime.now()
-                result = await current_agent.process({
-                    "action": "respond",
-                    "word": current_word,
-                    "opponent": opponent_agent.name
-                })
-                elapsed = (datetime.now() - start_time).total_seconds()
+                # 現在のエージェントに応答させる
+                result, elapsed = await self._take_turn(
+                    current_agent, current_word, opponent_agent
+                )
 
                 # エラーチェック
                 if not result["success"]:
                     error_msg = result.get("error", "不明なエラー")
-                    print()
-                    print(f"❌ {current_agent.name} がエラー: {error_msg}")
+                    self._emit()
+                    self._emit(f"❌ {current_agent.name} がエラー: {error_msg}")
 
                     # ゲーム終了判定
                     if result.get("is_game_over", False):
@@ -229,15 +410,10 @@ class ShiritoriGame:
                 current_word = result["word"]
 
                 self._print_turn(current_turn, current_agent.name, current_word, elapsed)
-                self.game_log.append({
-                    "turn": current_turn,
-                    "agent": current_agent.name,
-                    "word": current_word,
-                    "elapsed_time": elapsed
-                })
+                self._record_turn(current_turn, current_agent.name, current_word, elapsed)
 
                 # 「ん」で終わったかチェック
-                if current_word[-1] == 'ん':
+                if current_word.endswith('ん'):
                     self.winner = opponent_agent.name
                     self.game_result = f"{current_agent.name}が「ん」で終わる単語を言いました"
 
@@ -276,12 +452,66 @@ class ShiritoriGame:
             return {
                 "winner": None,
                 "reason": error_msg,
-                "turns": len(self.game_log),
+                "turns": len(self._log_words),
                 "game_log": self.game_log,
                 "result": "error"
             }
 
 
+def _positive_int(value: str) -> int:
+    """
+    1以上の整数としてコマンドライン引数を変換
+
+    Args:
+        value: 引数の文字列
+
+    Returns:
+        変換した整数
+
+    Raises:
+        argparse.ArgumentTypeError: 整数でない、または1未満の場合
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"整数を指定してください: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1以上を指定してください: {value}")
+    return number
+
+
+def _print_summary(results: List[Dict[str, Any]]) -> None:
+    """
+    複数ゲームの集計結果を表示
+
+    Args:
+        results: 各ゲームの結果
+    """
+    wins: Dict[str, int] = {}
+    draws = 0
+    errors = 0
+    for result in results:
+        winner = result.get("winner")
+        if winner:
+            wins[winner] = wins.get(winner, 0) + 1
+        elif result.get("result") == "error":
+            errors += 1
+        else:
+            draws += 1
+
+    print()
+    print("=" * 80)
+    print(f"📈 集計結果（{len(results)}ゲーム）")
+    print("=" * 80)
+    for name, count in sorted(wins.items(), key=lambda item: -item[1]):
+        print(f"{name}: {count}勝")
+    print(f"引き分け: {draws}")
+    if errors:
+        print(f"エラー: {errors}")
+    print(f"総ターン数: {sum(result.get('turns', 0) for result in results)}")
+    print("=" * 80)
+
+
 async def main():
     """
     メイン実行関数
@@ -316,18 +546,49 @@ async def main():
         default=os.getenv("AGENT2_NAME", "フレア"),
         help="エージェント2の名前（デフォルト: フレア、環境変数: AGENT2_NAME）"
     )
+    parser.add_argument(
+        "--parallel",
+        type=_positive_int,
+        default=os.getenv("SHIRITORI_PARALLEL", "1"),
+        help="同時に実行するゲーム数（デフォルト: 1、環境変数: SHIRITORI_PARALLEL）"
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=_positive_int,
+        default=os.getenv("SHIRITORI_MAX_CONCURRENCY", "60"),
+        help="LLM呼び出しの最大同時実行数（デフォルト: 60、環境変数: SHIRITORI_MAX_CONCURRENCY）"
+    )
 
     args = parser.parse_args()
 
-    # ゲームを作成して実行
-    game = ShiritoriGame(
-        agent1_name=args.agent1_name,
-        agent2_name=args.agent2_name,
-        max_turns=args.max_turns,
-        timeout=args.timeout
-    )
-
-    result = await game.play()
+    result: Union[Dict[str, Any], List[Dict[str, Any]]]
+    if args.parallel > 1:
+        # 複数ゲームを並行実行（奇数番目のゲームは先攻と後攻を入れ替える）
+        # 各ゲームの出力が混ざっても区別できるよう、行頭にゲーム番号を付ける
+        semaphore = asyncio.Semaphore(args.max_concurrency)
+        games = [
+            ShiritoriGame(
+                agent1_name=args.agent1_name if i % 2 == 0 else args.agent2_name,
+                agent2_name=args.agent2_name if i % 2 == 0 else args.agent1_name,
+                max_turns=args.max_turns,
+                timeout=args.timeout,
+                semaphore=semaphore,
+                label=f"#{i + 1}"
+            )
+            for i in range(args.parallel)
+        ]
+        result = list(await asyncio.gather(*(game.play() for game in games)))
+        _print_summary(result)
+    else:
+        # ゲームを作成して実行
+        game = ShiritoriGame(
+            agent1_name=args.agent1_name,
+            agent2_name=args.agent2_name,
+            max_turns=args.max_turns,
+            timeout=args.timeout
+        )
+
+        result = await game.play()
 
     # 結果をログに出力（オプション）
     if os.getenv("SAVE_GAME_LOG", "false").lower() == "true":
@@ -339,5 +600,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    # 非同期関数を実行
-    asyncio.run(main())
+    # 非同期関数を実行（uvloopがあればlibuvベースのイベントループを使用）
+    run(main())
@@ -4,10 +4,31 @@
 すべてのAIエージェントが継承する基底クラスを定義します。
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from collections import deque
+from typing import Deque, Dict, Any, Optional, List
 from datetime import datetime
 
+# 対話履歴の最大保持件数のデフォルト値
+DEFAULT_HISTORY_MAX = 1024
+
+
+def _with_iso_timestamp(interaction: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    timestamp_nsのみを持つ履歴にISO形式の"timestamp"を付与
+
+    Args:
+        interaction: 対話履歴の1件
+
+    Returns:
+        "timestamp"を付与した辞書（付与不要の場合は元の辞書）
+    """
+    if "timestamp" in interaction or "timestamp_ns" not in interaction:
+        return interaction
+    timestamp = datetime.fromtimestamp(interaction["timestamp_ns"] / 1_000_000_000)
+    return {**interaction, "timestamp": timestamp.isoformat()}
+
 
 class BaseAgent(ABC):
     """
@@ -18,20 +39,24 @@ class BaseAgent(ABC):
     Attributes:
         name (str): エージェントの名前
         config (Dict[str, Any]): エージェントの設定情報
-        history (List[Dict[str, Any]]): 対話履歴
+        history (Deque[Dict[str, Any]]): 対話履歴（古いものから破棄される）
     """
 
+    __slots__ = ("name", "config", "history")
+
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         """
         エージェントの初期化
 
         Args:
             name: エージェント名
-            config: 設定情報（オプション）
+            config: 設定情報（オプション）。"history_max"で履歴の最大件数を指定可能
         """
         self.name = name
         self.config = config or {}
-        self.history: List[Dict[str, Any]] = []
+        self.history: Deque[Dict[str, Any]] = deque(
+            maxlen=self.config.get("history_max", DEFAULT_HISTORY_MAX)
+        )
 
     @abstractmethod
     async def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -58,20 +83,26 @@ class BaseAgent(ABC):
         Args:
             interaction: 対話の内容（input, output, timestampなど）
         """
-        # タイムスタンプが含まれていない場合は追加
+        # タイムスタンプが含まれていない場合はエポックからのナノ秒を追加
         if "timestamp" not in interaction:
-            interaction["timestamp"] = datetime.now().isoformat()
+            interaction.setdefault("timestamp_ns", time.time_ns())
 
         self.history.append(interaction)
 
-    def get_history(self) -> List[Dict[str, Any]]:
+    def get_history(self, human: bool = False) -> List[Dict[str, Any]]:
         """
         対話履歴を取得
 
+        Args:
+            human: Trueの場合、timestamp_nsをISO形式の"timestamp"に変換して付与
+
         Returns:
             対話履歴のリスト（コピー）
         """
-        return self.history.copy()
+        if not human:
+            return list(self.history)
+
+        return [_with_iso_timestamp(h) for h in self.history]
 
     def clear_history(self) -> None:
         """
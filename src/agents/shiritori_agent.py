@@ -6,14 +6,44 @@ A2Aプロトコルを使用して日本語のしりとりを行うエージェ
 
 import asyncio
 import re
-from typing import Dict, Any, Optional, Set
-from datetime import datetime
+from collections import deque
+from typing import Deque, Dict, Any, Optional, Set, Tuple
 
 from .base_agent import BaseAgent
 from ..services.a2a_protocol import A2AProtocol
 from ..services.google_adk import GoogleADKService
+from ..services.runtime import wait_with_timeout
 from ..models.a2a_message import A2AMessage, MessageType
 
+# ひらがな以外の文字にマッチする正規表現（モジュール読み込み時に一度だけコンパイル）
+# str.translateはLatin-1外の文字で1文字ごとにテーブル参照が発生し、
+# ひらがな主体の文字列ではこの正規表現のsubより遅いため採用していない
+_NON_HIRAGANA_RE = re.compile(r'[^\u3040-\u309F]')
+
+# 単語生成時のtemperatureのデフォルト値
+DEFAULT_TEMPERATURE = 0.7
+
+
+def _process_word(raw: str) -> Tuple[str, bool, bool]:
+    """
+    単語のクリーニングと検証を一度に行う
+
+    Args:
+        raw: クリーニング前の単語
+
+    Returns:
+        (クリーニング後の単語, 有効かどうか, 「ん」で終わるかどうか)のタプル
+    """
+    cleaned = _NON_HIRAGANA_RE.sub('', raw)
+    return cleaned, bool(cleaned), cleaned.endswith('ん')
+
+
+# ゲーム開始時のプロンプト
+_START_PROMPT = """日本語のしりとりゲームを始めます。
+最初の単語を1つだけ、ひらがなで答えてください。
+「ん」で終わらない、一般的な名詞を選んでください。
+単語のみを答えてください。"""
+
 
 class ShiritoriAgent(BaseAgent):
     """
@@ -25,9 +55,33 @@ class ShiritoriAgent(BaseAgent):
         protocol: A2Aプロトコルインスタンス
         adk_service: Google ADKサービス
         used_words: 使用済み単語のセット
+        _recent_used: プロンプトに含める直近の使用済み単語
+        _temperature: 単語生成時のtemperature
         timeout: レスポンスタイムアウト（秒）
     """
 
+    __slots__ = (
+        "protocol",
+        "adk_service",
+        "used_words",
+        "_recent_used",
+        "timeout",
+        "_temperature",
+        "game_state",
+    )
+
+    # 応答時のプロンプトテンプレート（前の単語, 先頭文字, 先頭文字, 直近の使用済み単語）
+    _RESPOND_PROMPT_TMPL = """しりとりゲームの続きです。
+前の単語: %s
+「%s」で始まる日本語の単語を1つだけ、ひらがなで答えてください。
+
+ルール:
+- 「%s」で始まる単語を選んでください
+- 「ん」で終わらない単語を選んでください
+- 既に使われた単語は使えません: %s
+- 一般的な名詞を選んでください
+- 単語のみを答えてください"""
+
     def __init__(
         self,
         name: str,
@@ -40,13 +94,20 @@ class ShiritoriAgent(BaseAgent):
         Args:
             name: エージェント名
             timeout: レスポンスタイムアウト（秒）
-            config: 追加設定
+            config: 追加設定。"temperature"で単語生成時のtemperatureを指定可能
         """
         super().__init__(name, config)
         self.protocol = A2AProtocol(agent_name=name, timeout=timeout)
         self.adk_service = GoogleADKService()
+        # strはハッシュ値をキャッシュするため、所属判定はsetのC実装による1回の探索で済む
+        # （Pythonで書いたBloomフィルタを前段に置くと判定が遅くなる）
         self.used_words: Set[str] = set()
+        self._recent_used: Deque[str] = deque(maxlen=5)
         self.timeout = timeout
+        self._temperature: float = self.get_config(
+            "temperature",
+            DEFAULT_TEMPERATURE
+        )
         self.game_state = {
             "is_playing": False,
             "current_word": None,
@@ -102,29 +163,18 @@ class ShiritoriAgent(BaseAgent):
             return {"success": False, "error": "相手のエージェント名が必要です"}
 
         # 最初の単語を生成
-        prompt = """日本語のしりとりゲームを始めます。
-最初の単語を1つだけ、ひらがなで答えてください。
-「ん」で終わらない、一般的な名詞を選んでください。
-単語のみを答えてください。"""
-
         try:
-            first_word = await asyncio.wait_for(
-                self.adk_service.generate_text(prompt),
-                timeout=self.timeout
-            )
-
-            # クリーニング：余計な文字を削除
-            first_word = self._clean_word(first_word)
+            # 生成・クリーニング・検証
+            first_word, is_valid, _ = await self._generate_word(_START_PROMPT)
 
-            # 検証
-            if not self._is_valid_word(first_word):
+            if not is_valid:
                 return {
                     "success": False,
                     "error": f"無効な単語が生成されました: {first_word}"
                 }
 
             # 使用済み単語に追加
-            self.used_words.add(first_word)
+            self._mark_used(first_word)
             self.game_state["current_word"] = first_word
             self.game_state["turn_count"] = 1
 
@@ -142,8 +192,7 @@ class ShiritoriAgent(BaseAgent):
             self.add_to_history({
                 "turn": 1,
                 "agent": self.name,
-                "word": first_word,
-                "timestamp": datetime.now().isoformat()
+                "word": first_word
             })
 
             return {
@@ -182,11 +231,13 @@ class ShiritoriAgent(BaseAgent):
                 "error": "前の単語と相手の名前が必要です"
             }
 
-        # 前の単語をクリーニング
-        previous_word = self._clean_word(previous_word)
-
-        # 検証
-        validation_result = self._validate_previous_word(previous_word)
+        # 前の単語をクリーニングして検証
+        previous_word, is_valid, ends_with_n = _process_word(previous_word)
+        validation_result = self._validation_result(
+            previous_word,
+            is_valid,
+            ends_with_n
+        )
         if not validation_result["valid"]:
             return {
                 "success": False,
@@ -194,33 +245,23 @@ class ShiritoriAgent(BaseAgent):
             }
 
         # 使用済み単語に追加
-        self.used_words.add(previous_word)
+        self._mark_used(previous_word)
 
         # 次の単語を生成
-        last_char = previous_word[-1]
-
-        prompt = f"""しりとりゲームの続きです。
-前の単語: {previous_word}
-「{last_char}」で始まる日本語の単語を1つだけ、ひらがなで答えてください。
+        last_char = previous_word[-1:]
 
-ルール:
-- 「{last_char}」で始まる単語を選んでください
-- 「ん」で終わらない単語を選んでください
-- 既に使われた単語は使えません: {', '.join(list(self.used_words)[-5:])}
-- 一般的な名詞を選んでください
-- 単語のみを答えてください"""
+        prompt = self._RESPOND_PROMPT_TMPL % (
+            previous_word,
+            last_char,
+            last_char,
+            ', '.join(self._recent_used)
+        )
 
         try:
-            next_word = await asyncio.wait_for(
-                self.adk_service.generate_text(prompt),
-                timeout=self.timeout
-            )
-
-            # クリーニング
-            next_word = self._clean_word(next_word)
+            # 生成・クリーニング・検証
+            next_word, is_valid, ends_with_n = await self._generate_word(prompt)
 
-            # 検証
-            if not self._is_valid_word(next_word):
+            if not is_valid:
                 return {
                     "success": False,
                     "error": f"無効な単語が生成されました: {next_word}",
@@ -228,7 +269,7 @@ class ShiritoriAgent(BaseAgent):
                     "winner": opponent
                 }
 
-            if next_word[0] != last_char:
+            if not next_word.startswith(last_char):
                 return {
                     "success": False,
                     "error": f"「{last_char}」で始まっていません: {next_word}",
@@ -244,7 +285,7 @@ class ShiritoriAgent(BaseAgent):
                     "winner": opponent
                 }
 
-            if next_word[-1] == 'ん':
+            if ends_with_n:
                 return {
                     "success": False,
                     "error": f"「ん」で終わってしまいました: {next_word}",
@@ -254,7 +295,7 @@ class ShiritoriAgent(BaseAgent):
                 }
 
             # 使用済み単語に追加
-            self.used_words.add(next_word)
+            self._mark_used(next_word)
             self.game_state["current_word"] = next_word
             self.game_state["turn_count"] += 1
 
@@ -272,8 +313,7 @@ class ShiritoriAgent(BaseAgent):
             self.add_to_history({
                 "turn": self.game_state["turn_count"],
                 "agent": self.name,
-                "word": next_word,
-                "timestamp": datetime.now().isoformat()
+                "word": next_word
             })
 
             return {
@@ -298,6 +338,30 @@ class ShiritoriAgent(BaseAgent):
                 "winner": opponent
             }
 
+    async def _generate_word(self, prompt: str) -> Tuple[str, bool, bool]:
+        """
+        プロンプトから単語を生成し、クリーニングと検証を行う
+
+        同一プロンプトの応答キャッシュはGoogleADKServiceが担当します
+        （temperatureがCACHEABLE_TEMPERATURE以下の場合のみ）。
+
+        Args:
+            prompt: プロンプト
+
+        Returns:
+            (クリーニング後の単語, 有効かどうか, 「ん」で終わるかどうか)のタプル
+
+        Raises:
+            asyncio.TimeoutError: 生成がタイムアウトした場合
+        """
+        return _process_word(await wait_with_timeout(
+            self.adk_service.generate_text(
+                prompt,
+                temperature=self._temperature
+            ),
+            self.timeout
+        ))
+
     async def _handle_shiritori_request(
         self,
         message: A2AMessage
@@ -325,64 +389,40 @@ class ShiritoriAgent(BaseAgent):
 
         return result
 
-    def _clean_word(self, word: str) -> str:
+    def _mark_used(self, word: str) -> None:
         """
-        単語をクリーニング
+        単語を使用済みとして記録
 
         Args:
-            word: クリーニング前の単語
-
-        Returns:
-            クリーニング後の単語
-        """
-        # 余計な文字を削除（句読点、空白、改行など）
-        word = re.sub(r'[。、！？\s\n\r「」『』（）()]', '', word)
-        # 全角英数字を半角に変換してから削除
-        word = word.strip()
-        # ひらがなのみを抽出
-        word = ''.join([c for c in word if '\u3040' <= c <= '\u309F'])
-        return word.lower()
-
-    def _is_valid_word(self, word: str) -> bool:
+            word: 使用済みにする単語
         """
-        単語が有効かチェック
-
-        Args:
-            word: チェックする単語
-
-        Returns:
-            有効な場合True
-        """
-        if not word:
-            return False
-
-        # ひらがなのみで構成されているか
-        if not all('\u3040' <= c <= '\u309F' for c in word):
-            return False
-
-        # 1文字以上か
-        if len(word) < 1:
-            return False
-
-        return True
-
-    def _validate_previous_word(self, word: str) -> Dict[str, Any]:
+        self.used_words.add(word)
+        self._recent_used.append(word)
+
+    @staticmethod
+    def _validation_result(
+        word: str,
+        is_valid: bool,
+        ends_with_n: bool
+    ) -> Dict[str, Any]:
         """
-        前の単語を検証
+        判定済みのフラグから前の単語の検証結果を作成
 
         Args:
-            word: 検証する単語
+            word: 検証した単語
+            is_valid: 有効な単語かどうか
+            ends_with_n: 「ん」で終わるかどうか
 
         Returns:
             検証結果
         """
-        if not self._is_valid_word(word):
+        if not is_valid:
             return {
                 "valid": False,
                 "reason": f"無効な単語です: {word}"
             }
 
-        if word[-1] == 'ん':
+        if ends_with_n:
             return {
                 "valid": False,
                 "reason": f"「ん」で終わっています: {word}"
@@ -393,6 +433,7 @@ class ShiritoriAgent(BaseAgent):
     def reset_game(self) -> None:
         """ゲーム状態をリセット"""
         self.used_words.clear()
+        self._recent_used.clear()
         self.game_state = {
             "is_playing": False,
             "current_word": None,
@@ -413,5 +454,5 @@ class ShiritoriAgent(BaseAgent):
             "turn_count": self.game_state["turn_count"],
             "used_words_count": len(self.used_words),
             "used_words": list(self.used_words),
-            "history": self.history
+            "history": self.get_history()
         }
@@ -5,19 +5,35 @@
 """
 
 import os
-from typing import Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # 環境変数の読み込み
 load_dotenv()
 
 
+def _env(key: str, default: str) -> str:
+    """
+    生成時に環境変数を読み込むフィールドを定義
+
+    Args:
+        key: 環境変数名
+        default: 未設定時のデフォルト値
+
+    Returns:
+        環境変数の値をデフォルトとするdataclassフィールド
+    """
+    return field(default_factory=lambda: os.getenv(key, default))
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
     """
     アプリケーション設定クラス
 
     環境変数から設定を読み込み、アプリケーション全体で
-    使用できるようにします。
+    使用できるようにします。生成後の変更はできません。
 
     Attributes:
         google_api_key (str): Google API Key
@@ -29,20 +45,20 @@ class Settings:
         test_mode (bool): テストモードかどうか
     """
 
-    def __init__(self):
-        """設定の初期化"""
-        # Google ADK設定
-        self.google_api_key: str = os.getenv("GOOGLE_API_KEY", "")
-        self.google_project_id: str = os.getenv("GOOGLE_PROJECT_ID", "")
-        self.google_location: str = os.getenv("GOOGLE_LOCATION", "us-central1")
+    # Google ADK設定
+    google_api_key: str = _env("GOOGLE_API_KEY", "")
+    google_project_id: str = _env("GOOGLE_PROJECT_ID", "")
+    google_location: str = _env("GOOGLE_LOCATION", "us-central1")
 
-        # アプリケーション設定
-        self.app_name: str = os.getenv("APP_NAME", "agent_shiritori")
-        self.app_env: str = os.getenv("APP_ENV", "development")
-        self.log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    # アプリケーション設定
+    app_name: str = _env("APP_NAME", "agent_shiritori")
+    app_env: str = _env("APP_ENV", "development")
+    log_level: str = _env("LOG_LEVEL", "INFO")
 
-        # テスト設定
-        self.test_mode: bool = os.getenv("TEST_MODE", "false").lower() == "true"
+    # テスト設定
+    test_mode: bool = field(
+        default_factory=lambda: os.getenv("TEST_MODE", "false").lower() == "true"
+    )
 
     def is_development(self) -> bool:
         """
@@ -78,10 +94,7 @@ class Settings:
         return True
 
 
-# シングルトンインスタンス
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     設定のシングルトンインスタンスを取得
@@ -89,7 +102,4 @@ def get_settings() -> Settings:
     Returns:
         設定インスタンス
     """
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
@@ -4,12 +4,113 @@ A2Aプロトコルメッセージモデル
 Agent-to-Agent通信のためのメッセージ構造を定義します。
 """
 
+import importlib.util
+import itertools
+import json
+import os
+import time
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Mapping, Optional, Union
 from datetime import datetime
 from enum import Enum
 
+# orjson パッケージがあればJSONシリアライズに使用（なければ標準のjson）
+if importlib.util.find_spec("orjson") is not None:
+    import orjson
 
+    def dumps_json(obj: Any) -> bytes:
+        """
+        オブジェクトをUTF-8のJSONバイト列に変換
+
+        Args:
+            obj: 変換するオブジェクト
+
+        Returns:
+            JSONのバイト列
+        """
+        return orjson.dumps(obj)
+else:
+    def dumps_json(obj: Any) -> bytes:
+        """
+        オブジェクトをUTF-8のJSONバイト列に変換
+
+        Args:
+            obj: 変換するオブジェクト
+
+        Returns:
+            JSONのバイト列
+        """
+        # orjsonと同じバイト列になるよう区切り文字の後の空白を省く
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+# メッセージIDの採番用カウンタ（プロセスID + 連番で一意にする）
+_id_counter = itertools.count()
+_PID = os.getpid()
+
+
+def _next_message_id() -> str:
+    """
+    新しいメッセージIDを採番
+
+    Returns:
+        「プロセスID-連番」形式のメッセージID
+    """
+    return f"{_PID}-{next(_id_counter)}"
+
+
+@lru_cache(maxsize=64)
+def _format_seconds(seconds: int) -> str:
+    """
+    エポック秒をISO形式に変換（同じ秒の変換結果は再利用）
+
+    Args:
+        seconds: エポックからの秒数
+
+    Returns:
+        秒までのISO形式の文字列
+    """
+    return datetime.fromtimestamp(seconds).isoformat()
+
+
+def _format_timestamp(timestamp_ns: int) -> str:
+    """
+    エポックからのナノ秒をISO形式に変換
+
+    Args:
+        timestamp_ns: エポックからのナノ秒（0は時刻不明）
+
+    Returns:
+        マイクロ秒までのISO形式の文字列（時刻不明の場合は空文字列）
+    """
+    if not timestamp_ns:
+        return ""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return f"{_format_seconds(seconds)}.{nanoseconds // 1000:06d}"
+
+
+def _parse_timestamp(value: Union[int, str, None]) -> int:
+    """
+    タイムスタンプをエポックからのナノ秒に変換
+
+    Args:
+        value: ナノ秒の整数、ISO形式の文字列、または時刻不明を表す空値
+
+    Returns:
+        エポックからのナノ秒（時刻不明の場合は0）
+    """
+    if not value:
+        return 0
+    if isinstance(value, int):
+        return value
+    parsed = datetime.fromisoformat(value)
+    return int(parsed.timestamp()) * 1_000_000_000 + parsed.microsecond * 1000
+
+
+# 列挙値の文字列リテラルはコンパイル時にインターン済みのため、
+# sys.internを改めて適用する必要はない（to_dictは常に同じ文字列オブジェクトを返す）
 class MessageType(Enum):
     """メッセージタイプの列挙型"""
     REQUEST = "request"          # リクエスト
@@ -27,7 +128,7 @@ class MessageStatus(Enum):
     FAILED = "failed"            # 失敗
 
 
-@dataclass
+@dataclass(slots=True)
 class A2AMessage:
     """
     A2Aプロトコルメッセージ
@@ -40,23 +141,40 @@ class A2AMessage:
         receiver: 受信者のエージェント名
         message_type: メッセージタイプ
         content: メッセージの内容
-        metadata: 追加のメタデータ
-        timestamp: メッセージ作成時刻
+        metadata: 追加のメタデータ（読み取り専用のMappingの場合あり）
+        timestamp: メッセージ作成時刻（エポックからのナノ秒、0は時刻不明）
         status: メッセージのステータス
     """
     sender: str
     receiver: str
     message_type: MessageType
     content: Dict[str, Any]
-    message_id: str = field(default_factory=lambda: datetime.now().strftime("%Y%m%d%H%M%S%f"))
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    message_id: str = field(default_factory=_next_message_id)
+    metadata: Mapping[str, Any] = field(default_factory=dict)
+    timestamp: int = field(default_factory=time.time_ns)
     status: MessageStatus = MessageStatus.PENDING
 
+    @property
+    def timestamp_dt(self) -> Optional[datetime]:
+        """
+        メッセージ作成時刻をdatetimeとして取得
+
+        Returns:
+            メッセージ作成時刻（時刻不明の場合はNone）
+        """
+        if not self.timestamp:
+            return None
+        seconds, nanoseconds = divmod(self.timestamp, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(
+            microsecond=nanoseconds // 1000
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """
         メッセージを辞書形式に変換
 
+        タイムスタンプはISO形式の文字列に変換されます。
+
         Returns:
             メッセージの辞書表現
         """
@@ -66,16 +184,30 @@ class A2AMessage:
             "receiver": self.receiver,
             "message_type": self.message_type.value,
             "content": self.content,
-            "metadata": self.metadata,
-            "timestamp": self.timestamp,
+            "metadata": (
+                self.metadata if type(self.metadata) is dict
+                else dict(self.metadata)
+            ),
+            "timestamp": _format_timestamp(self.timestamp),
             "status": self.status.value
         }
 
+    def to_json(self) -> bytes:
+        """
+        メッセージをJSONバイト列に変換
+
+        Returns:
+            メッセージのJSON表現（UTF-8）
+        """
+        return dumps_json(self.to_dict())
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "A2AMessage":
         """
         辞書からメッセージを作成
 
+        タイムスタンプがない場合は現在時刻ではなく時刻不明（0）として扱います。
+
         Args:
             data: メッセージデータの辞書
 
@@ -89,7 +221,7 @@ class A2AMessage:
             message_type=MessageType(data["message_type"]),
             content=data["content"],
             metadata=data.get("metadata", {}),
-            timestamp=data.get("timestamp", datetime.now().isoformat()),
+            timestamp=_parse_timestamp(data.get("timestamp")),
             status=MessageStatus(data.get("status", "pending"))
         )
 
@@ -5,11 +5,25 @@ Agent-to-Agent通信プロトコルの実装
 """
 
 import asyncio
-from typing import Dict, Optional, Callable, Any
+import inspect
+import math
+from types import MappingProxyType
+from typing import (
+    Any, Callable, ClassVar, Dict, Iterable, Iterator, Mapping, Optional,
+    Union
+)
 from datetime import datetime
-from collections import deque
+from collections import OrderedDict, deque
+from itertools import islice
 
-from ..models.a2a_message import A2AMessage, MessageType, MessageStatus
+from ..models.a2a_message import A2AMessage, MessageType, MessageStatus, dumps_json
+from .runtime import wait_with_timeout
+
+# 送受信履歴それぞれに保持するメッセージ数の既定上限
+DEFAULT_MAX_HISTORY = 10_000
+
+# メタデータ未指定時に共有する読み取り専用の空マッピング
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
 
 
 class A2AProtocol:
@@ -23,22 +37,54 @@ class A2AProtocol:
         message_queue: メッセージキュー
         handlers: メッセージハンドラーの辞書
         timeout: デフォルトのタイムアウト時間（秒）
+        max_history: 送受信履歴それぞれの最大保持件数（超過分は古い順に破棄）
     """
 
-    def __init__(self, agent_name: str, timeout: float = 180.0):
+    # クラスの全インスタンスで共有するハンドラー（インスタンスのハンドラーが優先）
+    _global_handlers: ClassVar[Dict[MessageType, Callable]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """サブクラスごとに独立した共通ハンドラーの辞書を用意"""
+        super().__init_subclass__(**kwargs)
+        cls._global_handlers = {}
+
+    def __init__(
+        self,
+        agent_name: str,
+        timeout: Optional[float] = 180.0,
+        max_history: int = DEFAULT_MAX_HISTORY
+    ):
         """
         A2Aプロトコルの初期化
 
         Args:
             agent_name: エージェント名
-            timeout: デフォルトのタイムアウト時間（秒）
+            timeout: デフォルトのタイムアウト時間（秒、Noneの場合はタイムアウトなし）
+            max_history: 送受信履歴それぞれの最大保持件数
         """
         self.agent_name = agent_name
         self.timeout = timeout
+        self.max_history = max_history
         self.message_queue: deque = deque()
-        self.handlers: Dict[str, Callable] = {}
-        self.sent_messages: Dict[str, A2AMessage] = {}
-        self.received_messages: Dict[str, A2AMessage] = {}
+        self.handlers: Dict[MessageType, Callable] = {}
+        self.sent_messages: OrderedDict[str, A2AMessage] = OrderedDict()
+        self.received_messages: OrderedDict[str, A2AMessage] = OrderedDict()
+
+    def _store(
+        self,
+        store: OrderedDict[str, A2AMessage],
+        message: A2AMessage
+    ) -> None:
+        """
+        メッセージを履歴に記録し、上限を超えた古いメッセージを破棄
+
+        Args:
+            store: 記録先の履歴（sent_messages / received_messages）
+            message: 記録するメッセージ
+        """
+        store[message.message_id] = message
+        while len(store) > self.max_history:
+            store.popitem(last=False)
 
     def register_handler(
         self,
@@ -52,14 +98,51 @@ class A2AProtocol:
             message_type: メッセージタイプ
             handler: ハンドラー関数
         """
-        self.handlers[message_type.value] = handler
+        self.handlers[message_type] = handler
+
+    @classmethod
+    def register_global_handler(
+        cls,
+        message_type: MessageType,
+        handler: Callable[[A2AMessage], Any]
+    ) -> None:
+        """
+        全インスタンス共通のハンドラーを登録
+
+        インスタンスにregister_handlerで同じメッセージタイプの
+        ハンドラーが登録されている場合は、そちらが優先されます。
+        登録はこのクラスのインスタンスにのみ有効で、サブクラスとは共有されません。
+
+        Args:
+            message_type: メッセージタイプ
+            handler: ハンドラー関数
+        """
+        cls._global_handlers[message_type] = handler
+
+    @classmethod
+    def unregister_global_handler(cls, message_type: MessageType) -> bool:
+        """
+        全インスタンス共通のハンドラーを登録解除
+
+        Args:
+            message_type: メッセージタイプ
+
+        Returns:
+            登録解除した場合True、登録されていなかった場合False
+        """
+        return cls._global_handlers.pop(message_type, None) is not None
+
+    @classmethod
+    def clear_global_handlers(cls) -> None:
+        """全インスタンス共通のハンドラーをすべて登録解除"""
+        cls._global_handlers.clear()
 
     async def send_message(
         self,
         receiver: str,
         message_type: MessageType,
         content: Dict[str, Any],
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Mapping[str, Any]] = None
     ) -> A2AMessage:
         """
         メッセージを送信
@@ -68,7 +151,7 @@ class A2AProtocol:
             receiver: 受信者のエージェント名
             message_type: メッセージタイプ
             content: メッセージ内容
-            metadata: 追加のメタデータ
+            metadata: 追加のメタデータ（未指定の場合は読み取り専用の空マッピングを共有）
 
         Returns:
             送信されたメッセージ
@@ -78,11 +161,11 @@ class A2AProtocol:
             receiver=receiver,
             message_type=message_type,
             content=content,
-            metadata=metadata or {}
+            metadata=metadata if metadata else _EMPTY_METADATA
         )
 
         message.status = MessageStatus.SENT
-        self.sent_messages[message.message_id] = message
+        self._store(self.sent_messages, message)
 
         return message
 
@@ -94,9 +177,13 @@ class A2AProtocol:
         """
         メッセージを受信して処理
 
+        ハンドラーは同期関数・非同期関数のどちらでも構いません。
+        タイムアウトは非同期ハンドラーにのみ適用され、0以下または
+        無限大が指定された場合はタイムアウトなしで待機します。
+
         Args:
             message: 受信したメッセージ
-            timeout: タイムアウト時間（秒）
+            timeout: タイムアウト時間（秒、Noneの場合はself.timeout）
 
         Returns:
             処理結果のメッセージ（ある場合）
@@ -108,20 +195,25 @@ class A2AProtocol:
             )
 
         message.status = MessageStatus.RECEIVED
-        self.received_messages[message.message_id] = message
+        self._store(self.received_messages, message)
 
         # ハンドラーがあれば実行
-        handler = self.handlers.get(message.message_type.value)
+        handler = (
+            self.handlers.get(message.message_type)
+            or self._global_handlers.get(message.message_type)
+        )
         if handler:
             try:
                 if timeout is None:
                     timeout = self.timeout
 
-                # タイムアウト付きでハンドラーを実行
-                response = await asyncio.wait_for(
-                    handler(message),
-                    timeout=timeout
-                )
+                response = handler(message)
+                if inspect.isawaitable(response):
+                    if timeout is None or timeout <= 0 or math.isinf(timeout):
+                        response = await response
+                    else:
+                        # タイムアウト付きでハンドラーを実行
+                        response = await wait_with_timeout(response, timeout)
 
                 message.status = MessageStatus.PROCESSED
 
@@ -136,34 +228,140 @@ class A2AProtocol:
 
             except asyncio.TimeoutError:
                 message.status = MessageStatus.FAILED
-                return await self.send_message(
-                    receiver=message.sender,
-                    message_type=MessageType.TIMEOUT,
-                    content={"error": "タイムアウト"},
-                    metadata={"request_id": message.message_id}
+                return self._make_error_response(
+                    message,
+                    MessageType.TIMEOUT,
+                    {"error": "タイムアウト"}
                 )
             except Exception as e:
                 message.status = MessageStatus.FAILED
-                return await self.send_message(
-                    receiver=message.sender,
-                    message_type=MessageType.ERROR,
-                    content={"error": str(e)},
-                    metadata={"request_id": message.message_id}
+                return self._make_error_response(
+                    message,
+                    MessageType.ERROR,
+                    {"error": str(e)}
                 )
 
         return None
 
-    def get_message_history(self) -> Dict[str, Any]:
+    def _make_error_response(
+        self,
+        original: A2AMessage,
+        message_type: MessageType,
+        content: Dict[str, Any]
+    ) -> A2AMessage:
+        """
+        受信メッセージに対するエラー応答を生成して送信済みとして記録
+
+        send_messageを経由せずに直接メッセージを生成します。
+
+        Args:
+            original: 処理に失敗した受信メッセージ
+            message_type: 応答のメッセージタイプ（TIMEOUT / ERROR）
+            content: 応答内容
+
+        Returns:
+            送信済みのエラー応答メッセージ
+        """
+        response = A2AMessage(
+            sender=self.agent_name,
+            receiver=original.sender,
+            message_type=message_type,
+            content=content,
+            metadata={"request_id": original.message_id},
+            status=MessageStatus.SENT
+        )
+        self._store(self.sent_messages, response)
+        return response
+
+    @staticmethod
+    def _iter_history(
+        store: OrderedDict[str, A2AMessage],
+        limit: Optional[int],
+        since_ts: Optional[int]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        履歴を絞り込んでから辞書形式で順に返す
+
+        絞り込みはto_dictの呼び出し前に行うため、対象外のメッセージは変換されません。
+        件数のみ指定した場合は最新側から必要な分だけを読みます。履歴は到着順で
+        タイムスタンプ順とは限らないため、時刻を指定した場合は全件を走査します。
+
+        Args:
+            store: 対象の履歴
+            limit: 最新から数えた最大件数（Noneの場合は全件）
+            since_ts: この時刻（エポックからのナノ秒）以降のメッセージのみ対象
+
+        Yields:
+            メッセージの辞書表現（古い順）
+        """
+        messages: Iterable[A2AMessage] = store.values()
+        if since_ts is not None:
+            messages = (msg for msg in messages if msg.timestamp >= since_ts)
+            if limit is not None:
+                messages = deque(messages, maxlen=limit)
+        elif limit is not None:
+            messages = reversed(list(islice(reversed(store.values()), limit)))
+        for msg in messages:
+            yield msg.to_dict()
+
+    def iter_sent(
+        self,
+        limit: Optional[int] = None,
+        since_ts: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        送信メッセージの履歴を辞書形式で順に返す
+
+        Args:
+            limit: 最新から数えた最大件数（Noneの場合は全件）
+            since_ts: この時刻（エポックからのナノ秒）以降のメッセージのみ対象
+
+        Returns:
+            送信メッセージの辞書表現を古い順に返すイテレータ
+        """
+        return self._iter_history(self.sent_messages, limit, since_ts)
+
+    def iter_received(
+        self,
+        limit: Optional[int] = None,
+        since_ts: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        受信メッセージの履歴を辞書形式で順に返す
+
+        Args:
+            limit: 最新から数えた最大件数（Noneの場合は全件）
+            since_ts: この時刻（エポックからのナノ秒）以降のメッセージのみ対象
+
+        Returns:
+            受信メッセージの辞書表現を古い順に返すイテレータ
+        """
+        return self._iter_history(self.received_messages, limit, since_ts)
+
+    def get_message_history(
+        self,
+        as_json: bool = False,
+        limit: Optional[int] = None,
+        since_ts: Optional[int] = None
+    ) -> Union[Dict[str, Any], bytes]:
         """
         メッセージ履歴を取得
 
+        Args:
+            as_json: Trueの場合、履歴全体を1回でJSONバイト列に変換して返す
+            limit: 送受信それぞれ最新から数えた最大件数（Noneの場合は全件）
+            since_ts: この時刻（エポックからのナノ秒）以降のメッセージのみ対象
+
         Returns:
-            送受信メッセージの履歴
+            送受信メッセージの履歴（as_jsonがTrueの場合はJSONバイト列）
         """
-        return {
-            "sent": [msg.to_dict() for msg in self.sent_messages.values()],
-            "received": [msg.to_dict() for msg in self.received_messages.values()]
+        history = {
+            "sent": list(self.iter_sent(limit, since_ts)),
+            "received": list(self.iter_received(limit, since_ts))
         }
+        if as_json:
+            return dumps_json(history)
+        return history
 
     def clear_history(self) -> None:
         """メッセージ履歴をクリア"""
@@ -8,7 +8,10 @@ from __future__ import annotations
 
 import importlib.util
 import os
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
+from typing import Optional, List, Dict, Any, Tuple, TYPE_CHECKING
 from dotenv import load_dotenv
 
 # 環境変数の読み込み
@@ -17,8 +20,42 @@ load_dotenv()
 # google-genai パッケージの存在チェック
 GENAI_AVAILABLE = importlib.util.find_spec("google.genai") is not None
 
+# 応答キャッシュの既定サイズ
+DEFAULT_CACHE_SIZE = 512
+
+# この温度以下の生成はほぼ決定的とみなし、応答をキャッシュする
+CACHEABLE_TEMPERATURE = 0.01
+
 if TYPE_CHECKING:
     from google import genai
+    from google.genai import types
+
+
+@lru_cache(maxsize=64)
+def _build_config(
+    temperature: float,
+    max_tokens: Optional[int]
+) -> "types.GenerateContentConfig":
+    """
+    生成設定を構築（同じ組み合わせの設定は使い回す）
+
+    google.genai.typesのインポートもキャッシュミス時にのみ行われます。
+
+    Args:
+        temperature: 生成の多様性（0.0-1.0）
+        max_tokens: 最大トークン数（Noneの場合は指定なし）
+
+    Returns:
+        GenerateContentConfigインスタンス
+    """
+    from google.genai import types
+
+    config_params: Dict[str, Any] = {
+        "temperature": temperature,
+    }
+    if max_tokens:
+        config_params["max_output_tokens"] = max_tokens
+    return types.GenerateContentConfig(**config_params)
 
 
 class GoogleADKService:
@@ -29,21 +66,33 @@ class GoogleADKService:
     テキスト生成などのAI機能を提供します。
     クライアントは初回のAPI呼び出し時に遅延初期化されます。
 
+    temperatureがCACHEABLE_TEMPERATURE以下の生成結果は、
+    (prompt, max_tokens, temperature)をキーにLRUキャッシュされます。
+
     Attributes:
         api_key (str): Google API Key
+        cache_size (int): 応答キャッシュの最大件数（0で無効）
     """
 
-    def __init__(self, api_key: Optional[str] = None, model_name: str = "gemini-3-flash-preview"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model_name: str = "gemini-3-flash-preview",
+        cache_size: int = DEFAULT_CACHE_SIZE
+    ):
         """
         Google ADKサービスの初期化
 
         Args:
             api_key: Google API Key（未指定の場合は環境変数から取得）
             model_name: 使用するモデル名（デフォルト: gemini-2.0-flash）
+            cache_size: 応答キャッシュの最大件数（0で無効）
         """
         self.api_key = api_key or os.getenv("GOOGLE_API_KEY")
         self._model_name = model_name
         self._client = None
+        self.cache_size = cache_size
+        self._cache: OrderedDict[Tuple[str, Optional[int], float], str] = OrderedDict()
 
     def _get_client(self) -> "genai.Client":
         """
@@ -71,6 +120,34 @@ class GoogleADKService:
             self._client = genai.Client(api_key=self.api_key)
         return self._client
 
+    async def warmup(self, ping: bool = True) -> None:
+        """
+        クライアントを事前に初期化
+
+        SDKのインポートとクライアント生成を前倒しし、
+        最初の生成リクエストでの遅延をなくします。
+
+        Args:
+            ping: Trueの場合、1トークンの生成を送って接続を確立しておく
+                （失敗しても例外は送出しない）
+
+        Raises:
+            ImportError: google-genaiパッケージがインストールされていない場合
+            ValueError: API Keyが設定されていない場合
+        """
+        client = self._get_client()
+        if not ping:
+            return
+
+        try:
+            await client.aio.models.generate_content(
+                model=self._model_name,
+                contents=".",
+                config=_build_config(0.0, 1)
+            )
+        except Exception:
+            pass
+
     async def generate_text(
         self,
         prompt: str,
@@ -91,28 +168,34 @@ class GoogleADKService:
         Raises:
             Exception: API呼び出しに失敗した場合
         """
-        try:
-            config_params: Dict[str, Any] = {
-                "temperature": temperature,
-            }
-            if max_tokens:
-                config_params["max_output_tokens"] = max_tokens
-
-            from google.genai import types
+        key = None
+        if self.cache_size > 0 and temperature <= CACHEABLE_TEMPERATURE:
+            key = (prompt, max_tokens, temperature)
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
 
+        try:
             client = self._get_client()
             response = await client.aio.models.generate_content(
                 model=self._model_name,
                 contents=prompt,
-                config=types.GenerateContentConfig(**config_params)
+                config=_build_config(temperature, max_tokens)
             )
             text = response.text
             if text is None:
                 raise Exception("レスポンスにテキストが含まれていません")
-            return text.strip()
+            text = text.strip()
         except Exception as e:
             raise Exception(f"テキスト生成に失敗しました: {str(e)}")
 
+        if key is not None:
+            self._cache[key] = text
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return text
+
     async def generate_with_context(
         self,
         prompt: str,
@@ -135,13 +218,11 @@ class GoogleADKService:
         Raises:
             Exception: API呼び出しに失敗した場合
         """
-        # コンテキストを含めたプロンプトを構築
-        context_text = "\n".join([
-            f"{item['role']}: {item['content']}"
-            for item in context
-        ])
-
-        full_prompt = f"{context_text}\n\nuser: {prompt}"
+        # コンテキストと最後のユーザー発言を1回の結合でプロンプトにする
+        full_prompt = "\n".join(chain(
+            (f"{item['role']}: {item['content']}" for item in context),
+            ("", f"user: {prompt}")
+        ))
 
         return await self.generate_text(full_prompt, max_tokens, temperature)
 
@@ -0,0 +1,77 @@
+"""
+非同期ランタイム設定
+
+イベントループの選択とタイムアウト処理の共通ヘルパーを提供します。
+"""
+
+import asyncio
+import importlib.util
+import sys
+from typing import Any, Awaitable, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+# uvloop パッケージの存在チェック（インストール済みならイベントループに使用）
+UVLOOP_AVAILABLE = importlib.util.find_spec("uvloop") is not None
+
+
+def install_uvloop() -> bool:
+    """
+    uvloopをasyncioのイベントループポリシーとして設定
+
+    以降に生成されるイベントループがlibuvベースになります。
+    独自にイベントループを起動するアプリケーション向けです。
+
+    Returns:
+        uvloopを設定できた場合True、未インストールの場合False
+    """
+    if not UVLOOP_AVAILABLE:
+        return False
+
+    import uvloop  # pyright: ignore[reportMissingImports]
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """
+    コルーチンを新しいイベントループで実行
+
+    uvloopがインストールされていればuvloopのイベントループを、
+    なければ標準のasyncioイベントループを使用します。
+
+    Args:
+        main: 実行するコルーチン
+
+    Returns:
+        コルーチンの戻り値
+    """
+    if UVLOOP_AVAILABLE:
+        import uvloop  # pyright: ignore[reportMissingImports]
+
+        return uvloop.run(main)
+    return asyncio.run(main)
+
+
+async def wait_with_timeout(aw: Awaitable[T], timeout: Optional[float]) -> T:
+    """
+    タイムアウト付きでawaitableを待機
+
+    Python 3.11以降では追加のTaskを生成しないasyncio.timeoutを使用し、
+    それ以前のバージョンではasyncio.wait_forにフォールバックします。
+
+    Args:
+        aw: 待機するawaitable
+        timeout: タイムアウト時間（秒、Noneの場合は無制限）
+
+    Returns:
+        awaitableの結果
+
+    Raises:
+        asyncio.TimeoutError: タイムアウトした場合
+    """
+    if sys.version_info >= (3, 11):
+        async with asyncio.timeout(timeout):
+            return await aw
+    return await asyncio.wait_for(aw, timeout=timeout)
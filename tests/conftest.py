@@ -6,7 +6,13 @@ Pytestフィクスチャ
 
 import pytest
 import os
-from typing import Dict, Any
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# テスト対象モジュールをコレクション前にまとめて読み込んでおく
+# （各テストファイルのインポートはsys.modulesのキャッシュから解決される）
+import src.models.a2a_message  # noqa: F401
+import src.services.a2a_protocol  # noqa: F401
+from src.agents.shiritori_agent import ShiritoriAgent
 
 
 @pytest.fixture
@@ -55,6 +61,35 @@ def sample_interaction() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture
+def make_agent(mocker) -> Callable[..., ShiritoriAgent]:
+    """
+    しりとりエージェントを生成するファクトリーフィクスチャ
+
+    generateを指定すると、エージェントのADKサービスのgenerate_textを
+    その関数に差し替えます（テスト終了時にmockerが元に戻します）。
+
+    Args:
+        mocker: pytest-mockのmockerフィクスチャ
+
+    Returns:
+        名前・generate_textの代替関数・追加の引数を受け取ってShiritoriAgentを返す関数
+    """
+    def _factory(
+        name: str,
+        generate: Optional[Callable[..., Awaitable[str]]] = None,
+        **kwargs: Any
+    ) -> ShiritoriAgent:
+        agent = ShiritoriAgent(name=name, **kwargs)
+        if generate is not None:
+            mocker.patch.object(
+                type(agent.adk_service), "generate_text", new=generate
+            )
+        return agent
+
+    return _factory
+
+
 @pytest.fixture(autouse=True)
 def setup_test_env(monkeypatch):
     """
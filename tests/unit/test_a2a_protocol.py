@@ -4,9 +4,14 @@ A2Aプロトコルのユニットテスト
 A2AProtocolクラスの主要な機能をテストします。
 """
 
+import asyncio
+import importlib.util
+import json
+import sys
 import pytest
 from unittest.mock import AsyncMock
 from src.services.a2a_protocol import A2AProtocol
+from src.models import a2a_message
 from src.models.a2a_message import A2AMessage, MessageType, MessageStatus
 
 
@@ -33,8 +38,80 @@ class TestA2AProtocol:
         # ハンドラーを登録
         protocol.register_handler(MessageType.REQUEST, test_handler)
 
-        assert MessageType.REQUEST.value in protocol.handlers
-        assert protocol.handlers[MessageType.REQUEST.value] == test_handler
+        assert MessageType.REQUEST in protocol.handlers
+        assert protocol.handlers[MessageType.REQUEST] == test_handler
+
+    @pytest.mark.asyncio
+    async def test_register_global_handler(self, monkeypatch):
+        """共通ハンドラー登録テスト"""
+        monkeypatch.setattr(A2AProtocol, "_global_handlers", {})
+
+        async def global_handler(message):
+            return {"handled_by": "global"}
+
+        async def local_handler(message):
+            return {"handled_by": "local"}
+
+        A2AProtocol.register_global_handler(MessageType.REQUEST, global_handler)
+
+        shared = A2AProtocol(agent_name="受信者")
+        local = A2AProtocol(agent_name="受信者")
+        local.register_handler(MessageType.REQUEST, local_handler)
+
+        def make_message():
+            return A2AMessage(
+                sender="送信者",
+                receiver="受信者",
+                message_type=MessageType.REQUEST,
+                content={}
+            )
+
+        shared_response = await shared.receive_message(make_message())
+        local_response = await local.receive_message(make_message())
+
+        assert shared_response.content["handled_by"] == "global"
+        assert local_response.content["handled_by"] == "local"
+
+    @pytest.mark.asyncio
+    async def test_unregister_global_handler(self, monkeypatch):
+        """共通ハンドラー登録解除テスト"""
+        monkeypatch.setattr(A2AProtocol, "_global_handlers", {})
+
+        async def global_handler(message):
+            return {"handled_by": "global"}
+
+        A2AProtocol.register_global_handler(MessageType.REQUEST, global_handler)
+        A2AProtocol.register_global_handler(MessageType.ERROR, global_handler)
+
+        assert A2AProtocol.unregister_global_handler(MessageType.REQUEST) is True
+        assert A2AProtocol.unregister_global_handler(MessageType.REQUEST) is False
+
+        protocol = A2AProtocol(agent_name="受信者")
+        message = A2AMessage(
+            sender="送信者",
+            receiver="受信者",
+            message_type=MessageType.REQUEST,
+            content={}
+        )
+        assert await protocol.receive_message(message) is None
+
+        A2AProtocol.clear_global_handlers()
+        assert A2AProtocol._global_handlers == {}
+
+    def test_global_handlers_per_subclass(self, monkeypatch):
+        """共通ハンドラーがサブクラス間で共有されないことのテスト"""
+        monkeypatch.setattr(A2AProtocol, "_global_handlers", {})
+
+        class CustomProtocol(A2AProtocol):
+            pass
+
+        def handler(message):
+            return None
+
+        CustomProtocol.register_global_handler(MessageType.REQUEST, handler)
+
+        assert CustomProtocol._global_handlers == {MessageType.REQUEST: handler}
+        assert A2AProtocol._global_handlers == {}
 
     @pytest.mark.asyncio
     async def test_send_message(self):
@@ -54,6 +131,28 @@ class TestA2AProtocol:
         assert message.status == MessageStatus.SENT
         assert message.message_id in protocol.sent_messages
 
+    @pytest.mark.asyncio
+    async def test_send_message_without_metadata(self):
+        """メタデータなしのメッセージ送信テスト"""
+        protocol = A2AProtocol(agent_name="送信者")
+
+        first = await protocol.send_message(
+            receiver="受信者",
+            message_type=MessageType.REQUEST,
+            content={}
+        )
+        second = await protocol.send_message(
+            receiver="受信者",
+            message_type=MessageType.REQUEST,
+            content={}
+        )
+
+        assert first.metadata is second.metadata
+        with pytest.raises(TypeError):
+            first.metadata["key"] = "value"
+        assert first.to_dict()["metadata"] == {}
+        assert json.loads(first.to_json())["metadata"] == {}
+
     @pytest.mark.asyncio
     async def test_receive_message_with_handler(self):
         """ハンドラー付きメッセージ受信テスト"""
@@ -81,6 +180,51 @@ class TestA2AProtocol:
         assert response is not None
         assert response.content["response"] == "処理完了"
 
+    @pytest.mark.asyncio
+    async def test_receive_message_sync_handler(self):
+        """同期ハンドラーでのメッセージ受信テスト"""
+        protocol = A2AProtocol(agent_name="受信者")
+
+        def sync_handler(message):
+            return {"response": "同期"}
+
+        protocol.register_handler(MessageType.REQUEST, sync_handler)
+
+        message = A2AMessage(
+            sender="送信者",
+            receiver="受信者",
+            message_type=MessageType.REQUEST,
+            content={"data": "test"}
+        )
+
+        response = await protocol.receive_message(message)
+
+        assert message.status == MessageStatus.PROCESSED
+        assert response.content["response"] == "同期"
+
+    @pytest.mark.asyncio
+    async def test_receive_message_without_timeout(self):
+        """タイムアウトなしでのメッセージ受信テスト"""
+        protocol = A2AProtocol(agent_name="受信者")
+
+        async def test_handler(message):
+            await asyncio.sleep(0.01)
+            return {"response": "完了"}
+
+        protocol.register_handler(MessageType.REQUEST, test_handler)
+
+        message = A2AMessage(
+            sender="送信者",
+            receiver="受信者",
+            message_type=MessageType.REQUEST,
+            content={"data": "test"}
+        )
+
+        response = await protocol.receive_message(message, timeout=0)
+
+        assert message.status == MessageStatus.PROCESSED
+        assert response.content["response"] == "完了"
+
     @pytest.mark.asyncio
     async def test_receive_message_timeout(self):
         """メッセージ受信タイムアウトテスト"""
@@ -135,6 +279,10 @@ class TestA2AProtocol:
         assert response is not None
         assert response.message_type == MessageType.ERROR
         assert "テストエラー" in response.content["error"]
+        assert response.receiver == "送信者"
+        assert response.status == MessageStatus.SENT
+        assert response.metadata["request_id"] == message.message_id
+        assert protocol.sent_messages[response.message_id] is response
 
     @pytest.mark.asyncio
     async def test_receive_message_wrong_receiver(self):
@@ -185,6 +333,88 @@ class TestA2AProtocol:
         assert history["sent"][0]["content"]["data"] == "sent"
         assert history["received"][0]["content"]["data"] == "received"
 
+    def test_get_message_history_filters(self):
+        """メッセージ履歴の絞り込みテスト"""
+        protocol = A2AProtocol(agent_name="テスト")
+
+        for i in range(5):
+            msg = A2AMessage(
+                sender="テスト",
+                receiver="相手",
+                message_type=MessageType.REQUEST,
+                content={"index": i},
+                timestamp=i * 1_000_000_000
+            )
+            protocol.sent_messages[msg.message_id] = msg
+
+        latest = protocol.get_message_history(limit=2)
+        assert [m["content"]["index"] for m in latest["sent"]] == [3, 4]
+        assert latest["received"] == []
+
+        since = protocol.get_message_history(since_ts=1_000_000_000)
+        assert [m["content"]["index"] for m in since["sent"]] == [1, 2, 3, 4]
+
+        both = list(protocol.iter_sent(limit=1, since_ts=2_000_000_000))
+        assert [m["content"]["index"] for m in both] == [4]
+
+    def test_get_message_history_since_out_of_order(self):
+        """到着順とタイムスタンプ順が異なる履歴の時刻絞り込みテスト"""
+        protocol = A2AProtocol(agent_name="テスト")
+
+        # 送信者の作成時刻は到着順に並ぶとは限らない（0は時刻不明）
+        for i, seconds in enumerate([9, 3, 0, 7]):
+            msg = A2AMessage(
+                sender="相手",
+                receiver="テスト",
+                message_type=MessageType.REQUEST,
+                content={"index": i},
+                timestamp=seconds * 1_000_000_000
+            )
+            protocol.received_messages[msg.message_id] = msg
+
+        since = list(protocol.iter_received(since_ts=5_000_000_000))
+        assert [m["content"]["index"] for m in since] == [0, 3]
+
+        latest = list(protocol.iter_received(limit=1, since_ts=5_000_000_000))
+        assert [m["content"]["index"] for m in latest] == [3]
+
+    def test_get_message_history_as_json(self):
+        """JSON形式のメッセージ履歴取得テスト"""
+        protocol = A2AProtocol(agent_name="テスト")
+
+        msg = A2AMessage(
+            sender="テスト",
+            receiver="相手",
+            message_type=MessageType.REQUEST,
+            content={"data": "送信"}
+        )
+        protocol.sent_messages[msg.message_id] = msg
+
+        history = json.loads(protocol.get_message_history(as_json=True))
+
+        assert len(history["sent"]) == 1
+        assert len(history["received"]) == 0
+        assert history["sent"][0]["content"]["data"] == "送信"
+
+    @pytest.mark.asyncio
+    async def test_max_history(self):
+        """メッセージ履歴の上限テスト"""
+        protocol = A2AProtocol(agent_name="テスト", max_history=3)
+
+        messages = [
+            await protocol.send_message(
+                receiver="相手",
+                message_type=MessageType.REQUEST,
+                content={"index": i}
+            )
+            for i in range(5)
+        ]
+
+        assert len(protocol.sent_messages) == 3
+        assert list(protocol.sent_messages) == [
+            msg.message_id for msg in messages[2:]
+        ]
+
     def test_clear_history(self):
         """履歴クリアテスト"""
         protocol = A2AProtocol(agent_name="テスト")
@@ -242,6 +472,97 @@ class TestA2AMessage:
         assert message_dict["metadata"]["key"] == "value"
         assert message_dict["status"] == "pending"
 
+    def test_message_to_dict_reflects_changes(self):
+        """フィールド変更後の辞書・JSON変換テスト"""
+        message = A2AMessage(
+            sender="送信者",
+            receiver="受信者",
+            message_type=MessageType.REQUEST,
+            content={"test": "データ"}
+        )
+
+        first = message.to_dict()
+        first["status"] = "改変"
+        assert message.to_dict()["status"] == "pending"
+
+        message.status = MessageStatus.SENT
+        message.receiver = "別の受信者"
+        assert message.to_dict()["status"] == "sent"
+        assert json.loads(message.to_json())["receiver"] == "別の受信者"
+
+    def test_message_id_unique(self):
+        """メッセージIDの一意性テスト"""
+        messages = [
+            A2AMessage(
+                sender="送信者",
+                receiver="受信者",
+                message_type=MessageType.REQUEST,
+                content={}
+            )
+            for _ in range(100)
+        ]
+
+        assert len({message.message_id for message in messages}) == 100
+
+    def test_message_timestamp_round_trip(self):
+        """タイムスタンプの辞書変換と復元テスト"""
+        message = A2AMessage(
+            sender="送信者",
+            receiver="受信者",
+            message_type=MessageType.REQUEST,
+            content={},
+            timestamp=1_700_000_000_123_456_000
+        )
+
+        message_dict = message.to_dict()
+        restored = A2AMessage.from_dict(message_dict)
+
+        assert isinstance(message_dict["timestamp"], str)
+        assert message_dict["timestamp"].endswith(".123456")
+        assert restored.timestamp == message.timestamp
+        assert restored.timestamp_dt.isoformat() == message_dict["timestamp"]
+
+    def test_message_from_dict_without_timestamp(self):
+        """タイムスタンプなしの辞書からの作成テスト"""
+        message = A2AMessage.from_dict({
+            "sender": "送信者",
+            "receiver": "受信者",
+            "message_type": "request",
+            "content": {}
+        })
+
+        assert message.timestamp == 0
+        assert message.timestamp_dt is None
+        assert message.to_dict()["timestamp"] == ""
+        assert A2AMessage.from_dict(message.to_dict()).timestamp == 0
+
+    def test_message_to_json(self):
+        """メッセージのJSON変換テスト"""
+        message = A2AMessage(
+            sender="送信者",
+            receiver="受信者",
+            message_type=MessageType.REQUEST,
+            content={"test": "データ"}
+        )
+
+        assert json.loads(message.to_json()) == message.to_dict()
+
+    def test_dumps_json_fallback_matches(self, monkeypatch):
+        """orjsonの有無でJSONバイト列が一致することのテスト"""
+        data = {"word": "りんご", "items": [1, 2], "nested": {"a": None}}
+        expected = '{"word":"りんご","items":[1,2],"nested":{"a":null}}'.encode()
+
+        # orjsonを見つからない状態にしてモジュールを別名で読み込み直す
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        spec = importlib.util.spec_from_file_location(
+            "_a2a_message_without_orjson", a2a_message.__file__
+        )
+        fallback = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(fallback)
+
+        assert a2a_message.dumps_json(data) == expected
+        assert fallback.dumps_json(data) == expected
+
     def test_message_from_dict(self):
         """辞書からメッセージ作成テスト"""
         data = {
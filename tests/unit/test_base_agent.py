@@ -38,7 +38,7 @@ class TestBaseAgent:
         agent = TestAgent(name="TestAgent")
 
         assert agent.name == "TestAgent"
-        assert agent.history == []
+        assert list(agent.history) == []
         assert agent.config == {}
 
     @pytest.mark.asyncio
@@ -83,7 +83,12 @@ class TestBaseAgent:
         history = agent.get_history()
 
         assert len(history) == 1
-        assert "timestamp" in history[0]
+        assert isinstance(history[0]["timestamp_ns"], int)
+
+        # human=TrueでISO形式のタイムスタンプが付与される
+        human_history = agent.get_history(human=True)
+        assert "timestamp" in human_history[0]
+        assert "timestamp" not in agent.get_history()[0]
 
     @pytest.mark.asyncio
     async def test_get_history(self):
@@ -100,6 +105,18 @@ class TestBaseAgent:
         history = agent.get_history()
         assert len(history) == 3
 
+    def test_history_max(self):
+        """履歴の最大件数制限のテスト"""
+        agent = TestAgent(name="TestAgent", config={"history_max": 2})
+
+        for i in range(3):
+            agent.add_to_history({"input": f"input_{i}"})
+
+        history = agent.get_history()
+        assert len(history) == 2
+        assert history[0]["input"] == "input_1"
+        assert history[1]["input"] == "input_2"
+
     @pytest.mark.asyncio
     async def test_clear_history(self):
         """履歴クリア機能のテスト"""
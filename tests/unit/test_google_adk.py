@@ -0,0 +1,85 @@
+"""
+GoogleADKServiceのユニットテスト
+
+Google ADKサービスの応答キャッシュをテストします。
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.services import google_adk
+from src.services.google_adk import GoogleADKService
+
+
+def make_service(cache_size: int = 512) -> GoogleADKService:
+    """API呼び出しをモック化したサービスを作成"""
+    service = GoogleADKService(api_key="test_key", cache_size=cache_size)
+    client = MagicMock()
+    client.aio.models.generate_content = AsyncMock(
+        return_value=MagicMock(text=" りんご ")
+    )
+    service._client = client
+    return service
+
+
+class TestGoogleADKService:
+    """GoogleADKServiceのテストクラス"""
+
+    @pytest.mark.asyncio
+    async def test_warmup(self):
+        """ウォームアップテスト"""
+        service = make_service()
+        generate = service._client.aio.models.generate_content
+
+        await service.warmup(ping=False)
+        assert generate.await_count == 0
+
+        generate.side_effect = Exception("接続エラー")
+        await service.warmup()
+        assert generate.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_warmup_without_api_key(self, monkeypatch):
+        """API Key未設定時のウォームアップテスト"""
+        monkeypatch.setattr(google_adk, "GENAI_AVAILABLE", True)
+        monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+        service = GoogleADKService(api_key=None)
+
+        with pytest.raises(ValueError):
+            await service.warmup()
+
+    @pytest.mark.asyncio
+    async def test_generate_text_cached(self):
+        """低温度での生成結果キャッシュテスト"""
+        service = make_service()
+        generate = service._client.aio.models.generate_content
+
+        first = await service.generate_text("プロンプト", temperature=0.0)
+        second = await service.generate_text("プロンプト", temperature=0.0)
+
+        assert first == second == "りんご"
+        assert generate.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_generate_text_not_cached(self):
+        """高温度・キャッシュ無効時は毎回生成するテスト"""
+        service = make_service()
+        generate = service._client.aio.models.generate_content
+
+        await service.generate_text("プロンプト", temperature=0.7)
+        await service.generate_text("プロンプト", temperature=0.7)
+        assert generate.await_count == 2
+
+        disabled = make_service(cache_size=0)
+        await disabled.generate_text("プロンプト", temperature=0.0)
+        await disabled.generate_text("プロンプト", temperature=0.0)
+        assert disabled._client.aio.models.generate_content.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_generate_text_cache_eviction(self):
+        """キャッシュ上限を超えた古い応答の破棄テスト"""
+        service = make_service(cache_size=2)
+
+        for prompt in ("a", "b", "c"):
+            await service.generate_text(prompt, temperature=0.0)
+
+        assert [key[0] for key in service._cache] == ["b", "c"]
@@ -0,0 +1,35 @@
+"""
+非同期ランタイムヘルパーのユニットテスト
+
+イベントループ設定とタイムアウト処理をテストします。
+"""
+
+import asyncio
+import pytest
+from src.services import runtime
+from src.services.runtime import install_uvloop, wait_with_timeout
+
+
+class TestRuntime:
+    """非同期ランタイムヘルパーのテストクラス"""
+
+    @pytest.mark.asyncio
+    async def test_wait_with_timeout(self):
+        """タイムアウト内に完了する場合のテスト"""
+
+        async def quick():
+            return "完了"
+
+        assert await wait_with_timeout(quick(), 1.0) == "完了"
+
+    @pytest.mark.asyncio
+    async def test_wait_with_timeout_expired(self):
+        """タイムアウトした場合のテスト"""
+        with pytest.raises(asyncio.TimeoutError):
+            await wait_with_timeout(asyncio.sleep(1.0), 0.01)
+
+    def test_install_uvloop_unavailable(self, monkeypatch):
+        """uvloop未インストール時のテスト"""
+        monkeypatch.setattr(runtime, "UVLOOP_AVAILABLE", False)
+
+        assert install_uvloop() is False
@@ -4,96 +4,121 @@
 ShiritoriAgentクラスの主要な機能をテストします。
 """
 
+import asyncio
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
-from src.agents.shiritori_agent import ShiritoriAgent
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable
+from unittest.mock import AsyncMock
+from src.agents.shiritori_agent import ShiritoriAgent, _process_word
 from src.models.a2a_message import MessageType
 
+# テストで使用するエージェント名と単語
+NOEL, FLARE = "ノエル", "フレア"
+W_RINGO, W_GORIRA = "りんご", "ごりら"
 
-class TestShiritoriAgent:
-    """しりとりエージェントのテストクラス"""
+# processに渡すリクエスト（processは入力を変更しないため読み取り専用で共有）
+REQ_START = MappingProxyType({"action": "start", "opponent": FLARE})
+REQ_RESPOND_RINGO = MappingProxyType({
+    "action": "respond",
+    "word": W_RINGO,
+    "opponent": NOEL
+})
 
-    @pytest.mark.asyncio
-    async def test_agent_initialization(self):
-        """エージェントの初期化テスト"""
-        agent = ShiritoriAgent(name="テストエージェント", timeout=5.0)
 
-        assert agent.name == "テストエージェント"
-        assert agent.timeout == 5.0
-        assert len(agent.used_words) == 0
-        assert agent.game_state["turn_count"] == 0
+def _amock(value: str) -> AsyncMock:
+    """
+    指定した単語を返すgenerate_textのモックを作成
 
-    @pytest.mark.asyncio
-    async def test_clean_word(self):
-        """単語のクリーニング機能テスト"""
-        agent = ShiritoriAgent(name="テスト")
+    Args:
+        value: モックが返す単語
 
-        # 正常な単語
-        assert agent._clean_word("りんご") == "りんご"
+    Returns:
+        AsyncMockインスタンス
+    """
+    return AsyncMock(return_value=value)
 
-        # 句読点を含む
-        assert agent._clean_word("りんご。") == "りんご"
 
-        # 空白を含む
-        assert agent._clean_word("り ん ご") == "りんご"
+def _generate_returning(value: str) -> Callable[..., Awaitable[str]]:
+    """
+    指定した単語を返すgenerate_textの代替関数を作成
 
-        # 改行を含む
-        assert agent._clean_word("りんご\n") == "りんご"
+    呼び出し履歴を確認しないテスト向けで、AsyncMockの記録処理を省きます。
 
-    @pytest.mark.asyncio
-    async def test_is_valid_word(self):
-        """単語の妥当性検証テスト"""
-        agent = ShiritoriAgent(name="テスト")
+    Args:
+        value: 返す単語
 
-        # 有効な単語
-        assert agent._is_valid_word("りんご") is True
-        assert agent._is_valid_word("ごりら") is True
+    Returns:
+        常にvalueを返すコルーチン関数
+    """
+    async def generate_text(*args: Any, **kwargs: Any) -> str:
+        return value
 
-        # 無効な単語
-        assert agent._is_valid_word("") is False  # 空文字
-        assert agent._is_valid_word("apple") is False  # 英語
-        assert agent._is_valid_word("リンゴ") is False  # カタカナ
-        assert agent._is_valid_word("林檎") is False  # 漢字
+    return generate_text
 
-    @pytest.mark.asyncio
-    async def test_validate_previous_word(self):
-        """前の単語の検証テスト"""
-        agent = ShiritoriAgent(name="テスト")
 
-        # 有効な単語
-        result = agent._validate_previous_word("りんご")
-        assert result["valid"] is True
+@pytest.fixture(scope="module")
+def ro_agent():
+    """
+    状態を変更しないテストで共有するエージェント
 
-        # 「ん」で終わる単語
-        result = agent._validate_previous_word("みかん")
-        assert result["valid"] is False
-        assert "ん" in result["reason"]
+    Returns:
+        ShiritoriAgentインスタンス
+    """
+    return ShiritoriAgent(name="テスト")
 
-        # 無効な単語
-        result = agent._validate_previous_word("apple")
-        assert result["valid"] is False
 
-    @pytest.mark.asyncio
-    async def test_reset_game(self):
-        """ゲームリセット機能テスト"""
-        agent = ShiritoriAgent(name="テスト")
+class TestShiritoriAgent:
+    """しりとりエージェントのテストクラス"""
 
-        # ゲーム状態を変更
-        agent.used_words.add("りんご")
-        agent.game_state["turn_count"] = 5
-        agent.add_to_history({"test": "data"})
+    @pytest.mark.parametrize("reset", [False, True], ids=["init", "reset"])
+    def test_clean_state(self, make_agent, reset):
+        """初期化直後・リセット後のゲーム状態テスト"""
+        agent = make_agent("テストエージェント", timeout=5.0)
 
-        # リセット
-        agent.reset_game()
+        if reset:
+            # ゲーム状態を変更してからリセット
+            agent.used_words.add("りんご")
+            agent.game_state["turn_count"] = 5
+            agent.add_to_history({"test": "data"})
+            agent.reset_game()
 
+        assert agent.name == "テストエージェント"
+        assert agent.timeout == 5.0
         assert len(agent.used_words) == 0
         assert agent.game_state["turn_count"] == 0
         assert len(agent.history) == 0
 
-    @pytest.mark.asyncio
-    async def test_get_game_stats(self):
+    @pytest.mark.parametrize("raw,expected", [
+        ("りんご", ("りんご", True, False)),      # 正常な単語
+        ("りんご。", ("りんご", True, False)),    # 句読点を含む
+        ("り ん ご", ("りんご", True, False)),    # 空白を含む
+        ("りんご\n", ("りんご", True, False)),    # 改行を含む
+        ("みかん", ("みかん", True, True)),       # 「ん」で終わる
+        ("", ("", False, False)),                 # 空文字
+        ("apple", ("", False, False)),            # 英語
+        ("リンゴ", ("", False, False)),           # カタカナ
+        ("林檎", ("", False, False)),             # 漢字
+    ])
+    def test_process_word(self, raw, expected):
+        """単語のクリーニングと妥当性検証テスト"""
+        assert _process_word(raw) == expected
+
+    @pytest.mark.parametrize("word,valid,reason", [
+        ("りんご", True, None),
+        ("みかん", False, "ん"),          # 「ん」で終わる単語
+        ("apple", False, "無効な単語"),   # 無効な単語
+    ])
+    def test_validation_result(self, word, valid, reason):
+        """前の単語の検証テスト"""
+        result = ShiritoriAgent._validation_result(word, *_process_word(word)[1:])
+
+        assert result["valid"] is valid
+        if reason is not None:
+            assert reason in result["reason"]
+
+    def test_get_game_stats(self, make_agent):
         """ゲーム統計取得テスト"""
-        agent = ShiritoriAgent(name="テスト")
+        agent = make_agent("テスト")
 
         agent.used_words.add("りんご")
         agent.used_words.add("ごりら")
@@ -107,143 +132,124 @@ class TestShiritoriAgent:
         assert "りんご" in stats["used_words"]
         assert "ごりら" in stats["used_words"]
 
-    @pytest.mark.asyncio
-    async def test_start_game_with_mock(self):
+    async def test_start_game_with_mock(self, make_agent):
         """ゲーム開始のモックテスト"""
-        agent = ShiritoriAgent(name="ノエル")
-
-        # Google ADKサービスをモック
-        with patch.object(
-            agent.adk_service,
-            'generate_text',
-            new=AsyncMock(return_value="りんご")
-        ):
-            result = await agent.process({
-                "action": "start",
-                "opponent": "フレア"
-            })
-
-            assert result["success"] is True
-            assert result["word"] == "りんご"
-            assert "りんご" in agent.used_words
-
-    @pytest.mark.asyncio
-    async def test_respond_to_word_with_mock(self):
+        agent = make_agent(NOEL, generate=_generate_returning(W_RINGO))
+
+        result = await agent.process(REQ_START)
+
+        assert result["success"] is True
+        assert result["word"] == W_RINGO
+        assert W_RINGO in agent.used_words
+
+    @pytest.mark.parametrize("config,temperature", [
+        ({}, 0.7),
+        ({"temperature": 0.0}, 0.0),
+    ], ids=["default", "configured"])
+    async def test_generate_temperature(self, make_agent, config, temperature):
+        """単語生成時にtemperatureが渡されることのテスト"""
+        mock = _amock(W_RINGO)
+        agent = make_agent(NOEL, generate=mock, config=config)
+
+        await agent.process(REQ_START)
+
+        assert mock.await_args.kwargs["temperature"] == temperature
+
+    async def test_respond_timeout(self, make_agent):
+        """単語生成のタイムアウトテスト"""
+        async def slow_generate(service, prompt, **kwargs):
+            await asyncio.sleep(1.0)
+            return W_GORIRA
+
+        agent = make_agent(FLARE, generate=slow_generate, timeout=0.05)
+        result = await agent.process(REQ_RESPOND_RINGO)
+
+        assert result["success"] is False
+        assert result["is_game_over"] is True
+        assert "タイムアウト" in result["error"]
+
+    async def test_respond_to_word_with_mock(self, make_agent):
         """単語応答のモックテスト"""
-        agent = ShiritoriAgent(name="フレア")
-
-        # Google ADKサービスをモック
-        with patch.object(
-            agent.adk_service,
-            'generate_text',
-            new=AsyncMock(return_value="ごりら")
-        ):
-            result = await agent.process({
-                "action": "respond",
-                "word": "りんご",
-                "opponent": "ノエル"
-            })
-
-            assert result["success"] is True
-            assert result["word"] == "ごりら"
-            assert "りんご" in agent.used_words
-            assert "ごりら" in agent.used_words
-            assert result["is_game_over"] is False
-
-    @pytest.mark.asyncio
-    async def test_respond_with_n_ending(self):
-        """「ん」で終わる単語の応答テスト"""
-        agent = ShiritoriAgent(name="フレア")
-
-        # 「ん」で終わる単語を返すようモック
-        with patch.object(
-            agent.adk_service,
-            'generate_text',
-            new=AsyncMock(return_value="らっぱ")
-        ):
-            # 最初に「ぱ」で始まる単語に応答
-            result1 = await agent.process({
-                "action": "respond",
-                "word": "えんぴつ",  # 実際は「つ」で終わる
-                "opponent": "ノエル"
-            })
-
-        # 次に「ん」で終わる単語を返すようモック
-        with patch.object(
-            agent.adk_service,
-            'generate_text',
-            new=AsyncMock(return_value="みかん")
-        ):
-            result2 = await agent.process({
-                "action": "respond",
-                "word": "かめ",
-                "opponent": "ノエル"
-            })
-
-            # 「ん」で終わったのでゲームオーバー
-            assert result2["success"] is False
-            assert result2["is_game_over"] is True
-            assert result2["winner"] == "ノエル"
-
-    @pytest.mark.asyncio
-    async def test_respond_with_duplicate_word(self):
-        """重複単語の応答テスト"""
-        agent = ShiritoriAgent(name="フレア")
-
-        # 既に使用済みの単語を追加
-        agent.used_words.add("ごりら")
+        agent = make_agent(FLARE, generate=_generate_returning(W_GORIRA))
 
-        # 同じ単語を返すようモック
-        with patch.object(
-            agent.adk_service,
-            'generate_text',
-            new=AsyncMock(return_value="ごりら")
-        ):
-            result = await agent.process({
-                "action": "respond",
-                "word": "りんご",
-                "opponent": "ノエル"
-            })
-
-            # 重複単語なのでゲームオーバー
-            assert result["success"] is False
-            assert result["is_game_over"] is True
-            assert "既に使われた" in result["error"]
-
-    @pytest.mark.asyncio
-    async def test_respond_with_wrong_starting_char(self):
-        """間違った文字で始まる単語の応答テスト"""
-        agent = ShiritoriAgent(name="フレア")
-
-        # 間違った文字で始まる単語を返すようモック
-        with patch.object(
-            agent.adk_service,
-            'generate_text',
-            new=AsyncMock(return_value="たぬき")  # 「ご」で始まるべきなのに「た」
-        ):
-            result = await agent.process({
-                "action": "respond",
-                "word": "りんご",
-                "opponent": "ノエル"
-            })
-
-            # 間違った文字で始まったのでゲームオーバー
-            assert result["success"] is False
-            assert result["is_game_over"] is True
-            assert "始まっていません" in result["error"]
+        result = await agent.process(REQ_RESPOND_RINGO)
+
+        assert result["success"] is True
+        assert result["word"] == W_GORIRA
+        assert W_RINGO in agent.used_words
+        assert W_GORIRA in agent.used_words
+        assert result["is_game_over"] is False
+
+    async def test_respond_with_n_ending(self, make_agent, mocker):
+        """「ん」で終わる単語の応答テスト"""
+        # 1回目は「つみき」、2回目は「ん」で終わる単語を返すようモック
+        agent = make_agent(
+            FLARE,
+            generate=mocker.AsyncMock(side_effect=["つみき", "めろん"])
+        )
+
+        # 最初に「つ」で始まる単語で応答
+        result1 = await agent.process({
+            "action": "respond",
+            "word": "えんぴつ",
+            "opponent": NOEL
+        })
+        assert result1["success"] is True
+
+        result2 = await agent.process({
+            "action": "respond",
+            "word": "かめ",
+            "opponent": NOEL
+        })
+
+        # 「ん」で終わったのでゲームオーバー
+        assert result2["success"] is False
+        assert result2["is_game_over"] is True
+        assert result2["winner"] == NOEL
+        assert "「ん」で終わ" in result2["error"]
+
+    @pytest.mark.parametrize("used_words,mock_word,expected_error", [
+        # 既に使用済みの単語を返す
+        ([W_GORIRA], W_GORIRA, "既に使われた"),
+        # 「ご」で始まるべきなのに「た」で始まる単語を返す
+        ([], "たぬき", "始まっていません"),
+    ])
+    async def test_respond_game_over(
+        self, make_agent, used_words, mock_word, expected_error
+    ):
+        """ルール違反の単語を応答した場合のゲームオーバーテスト"""
+        agent = make_agent(FLARE, generate=_generate_returning(mock_word))
+        agent.used_words.update(used_words)
+
+        result = await agent.process(REQ_RESPOND_RINGO)
+
+        assert result["success"] is False
+        assert result["is_game_over"] is True
+        assert expected_error in result["error"]
+
+    @pytest.mark.slow
+    async def test_process_benchmark(self, async_benchmark, make_agent):
+        """単語応答処理の性能計測（実行時間に依存するためslowマーカー付き）"""
+        agent = make_agent(FLARE, generate=_generate_returning(W_GORIRA))
+
+        async def respond():
+            # 毎回新しいゲームとして応答させ、重複単語によるゲームオーバーを避ける
+            agent.reset_game()
+            return await agent.process(REQ_RESPOND_RINGO)
+
+        result = await async_benchmark(respond, rounds=20, iterations=10)
+
+        assert result["mean"] < 0.01
 
 
 class TestA2AMessageIntegration:
     """A2Aメッセージ統合テスト"""
 
-    @pytest.mark.asyncio
-    async def test_protocol_message_handling(self):
+    def test_protocol_message_handling(self, ro_agent):
         """A2Aプロトコルのメッセージハンドリングテスト"""
-        agent = ShiritoriAgent(name="ノエル")
-
         # プロトコルが正しく初期化されているか
-        assert agent.protocol is not None
-        assert agent.protocol.agent_name == "ノエル"
+        assert ro_agent.protocol is not None
+        assert ro_agent.protocol.agent_name == ro_agent.name
 
         # ハンドラーが登録されているか
-        assert MessageType.REQUEST.value in agent.protocol.handlers
+        assert MessageType.REQUEST in ro_agent.protocol.handlers
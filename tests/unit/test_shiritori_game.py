@@ -0,0 +1,138 @@
+"""
+しりとりゲーム実行プログラムのユニットテスト
+
+ShiritoriGameクラスとコマンドライン処理をテストします。
+"""
+
+import argparse
+import asyncio
+import pytest
+from shiritori_game import ShiritoriGame, _positive_int, _print_summary, main
+from src.services.google_adk import GoogleADKService
+
+# スタブのgenerate_textが順に返す単語（3ターンで引き分けになる）
+CHAIN = ["りんご", "ごりら", "らっぱ"]
+
+
+@pytest.fixture
+def stub_generate(mocker):
+    """
+    generate_textをCHAINの単語を順に返すモックに差し替えるフィクスチャ
+
+    Args:
+        mocker: pytest-mockのmockerフィクスチャ
+
+    Returns:
+        差し替えたAsyncMock
+    """
+    return mocker.patch.object(
+        GoogleADKService, "generate_text", new=mocker.AsyncMock(side_effect=CHAIN)
+    )
+
+
+class TestShiritoriGame:
+    """しりとりゲームのテストクラス"""
+
+    @pytest.mark.parametrize("value,expected", [("1", 1), ("60", 60)])
+    def test_positive_int(self, value, expected):
+        """1以上の整数の変換テスト"""
+        assert _positive_int(value) == expected
+
+    @pytest.mark.parametrize("value", ["0", "-1", "x"])
+    def test_positive_int_invalid(self, value):
+        """1未満・整数以外の値の拒否テスト"""
+        with pytest.raises(argparse.ArgumentTypeError):
+            _positive_int(value)
+
+    @pytest.mark.parametrize("option", ["--parallel", "--max-concurrency"])
+    async def test_main_rejects_non_positive(self, monkeypatch, option):
+        """並行数・同時実行数に0を指定した場合のテスト"""
+        monkeypatch.setattr("sys.argv", ["shiritori_game.py", option, "0"])
+
+        with pytest.raises(SystemExit):
+            await main()
+
+    def test_print_summary(self, capsys):
+        """複数ゲームの集計結果表示テスト"""
+        _print_summary(
+            [
+                {"winner": "ノエル", "turns": 5},
+                {"winner": "フレア", "turns": 4},
+                {"winner": "ノエル", "turns": 3},
+                {"winner": None, "result": "draw", "turns": 20},
+                {"winner": None, "result": "error", "turns": 0},
+            ]
+        )
+
+        out = capsys.readouterr().out
+        assert "集計結果（5ゲーム）" in out
+        assert out.index("ノエル: 2勝") < out.index("フレア: 1勝")
+        assert "引き分け: 1" in out
+        assert "エラー: 1" in out
+        assert "総ターン数: 32" in out
+
+    async def test_play_with_label(self, stub_generate, capsys):
+        """ラベル指定時に全出力行へゲーム番号が付くことのテスト"""
+        game = ShiritoriGame(max_turns=3, timeout=5.0, label="#2")
+
+        result = await game.play()
+
+        assert result["result"] == "draw"
+        assert [entry["word"] for entry in result["game_log"]] == CHAIN
+        lines = capsys.readouterr().out.splitlines()
+        assert lines
+        assert all(line.startswith("[#2] ") for line in lines)
+
+    async def test_play_without_label(self, stub_generate, capsys):
+        """ラベル未指定時は出力行に番号が付かないことのテスト"""
+        game = ShiritoriGame(max_turns=3, timeout=5.0)
+
+        await game.play()
+
+        out = capsys.readouterr().out
+        assert "[#" not in out
+        assert "ターン   1 | ノエル" in out
+
+    async def test_play_flushes_output_in_order(self, stub_generate, capsys):
+        """ゲーム終了時に全出力が順序どおり書き出されることのテスト"""
+        game = ShiritoriGame(max_turns=3, timeout=5.0)
+        before = asyncio.all_tasks()
+
+        await game.play()
+
+        # 書き込みタスクはplay()の終了までに完了している
+        assert asyncio.all_tasks() - before == set()
+        assert game._log_q is None
+
+        out = capsys.readouterr().out
+        markers = [
+            "しりとりゲーム - A2Aプロトコル版",
+            "ゲーム開始",
+            "ターン   1 | ノエル",
+            "ターン   2 | フレア",
+            "ターン   3 | ノエル",
+            "ゲーム終了",
+            "ゲーム統計",
+            "全使用単語: りんご → ごりら → らっぱ",
+        ]
+        positions = [out.index(marker) for marker in markers]
+        assert positions == sorted(positions)
+
+    async def test_play_flushes_output_on_error(self, mocker, capsys):
+        """_playが例外を送出した場合も出力が書き出されることのテスト"""
+        game = ShiritoriGame(max_turns=3, timeout=5.0)
+
+        async def failing_play(self):
+            self._emit("1行目")
+            self._emit("2行目")
+            raise RuntimeError("失敗")
+
+        mocker.patch.object(ShiritoriGame, "_play", new=failing_play)
+        before = asyncio.all_tasks()
+
+        with pytest.raises(RuntimeError):
+            await game.play()
+
+        assert asyncio.all_tasks() - before == set()
+        assert game._log_q is None
+        assert capsys.readouterr().out == "1行目\n2行目\n"